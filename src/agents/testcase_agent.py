@@ -1,27 +1,153 @@
 from __future__ import annotations
 
-import sys
+import argparse
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
-from src.core import chat, pick_requirement, parse_json_safely, to_rows, write_csv
+from typing import Any, Callable, List, Dict, NamedTuple, Optional, Union
+from src.core import (
+    achat,
+    pick_requirements,
+    parse_json_safely,
+    parse_json_object_safely,
+    to_rows,
+    write_csv,
+)
+from src.core.utils import save_raw
 from langchain_core.prompts import PromptTemplate
-from src.integrations.testrail import map_case_to_testrail_payload, create_case, list_cases
-from src.integrations.testrail import add_result
+from src.integrations.testrail import (
+    TESTRAIL_BASE,
+    TESTRAIL_PROJECT_ID,
+    add_result,
+    create_case,
+    list_cases,
+    map_case_to_testrail_payload,
+)
 
 ROOT = Path(__file__).resolve().parents[2]
 REQ_DIR = ROOT / "data" / "requirements"  # directory with .txt requirement files
 OUT_DIR = ROOT / "outputs" / "testcase_generated"  # where outputs are written
 OUT_DIR.mkdir(parents=True, exist_ok=True)
-OUT_CSV = OUT_DIR / "test_cases.csv"  # CSV output path
 LAST_RAW_JSON = OUT_DIR / "last_raw.json"  # file where raw LLM text is saved
+TITLE_CACHE = OUT_DIR / "testrail_titles.json"  # TestRail title keys + fetch cursor
+TESTRAIL_WORKERS = 8  # concurrent create_case + add_result pairs
 PROMPTS_DIR = ROOT / "src" / "core" / "prompts"
-SYSTEM_PROMPT = (PROMPTS_DIR/ "testcase_system.txt").read_text(encoding="utf-8")
-USER_TEMPLATE = (PROMPTS_DIR/ "testcase_user.txt").read_text(encoding="utf-8")
 
 Message = Dict[str, str]
 
+
+class _Prompts(NamedTuple):
+    system: str
+    user: PromptTemplate
+    batch_system: str
+    batch_user: PromptTemplate
+
+
+@functools.lru_cache(maxsize=1)
+def _load_prompts() -> _Prompts:
+    """Read the prompt files and compile the user templates once per process."""
+    def read(name: str) -> str:
+        return (PROMPTS_DIR / name).read_text(encoding="utf-8")
+
+    return _Prompts(
+        system=read("testcase_system.txt"),
+        user=PromptTemplate.from_template(read("testcase_user.txt")),
+        batch_system=read("testcase_batch_system.txt"),
+        batch_user=PromptTemplate.from_template(read("testcase_batch_user.txt")),
+    )
+
+
+# Test-case schema (mirrors testcase_system.txt): field -> accepted JSON types.
+# Every field is optional (to_rows fills defaults) but must have the right type.
+# Cases that break it are logged and dropped; the rest of the batch is kept.
+CASE_SCHEMA: Dict[str, tuple] = {
+    "id": (str, int),
+    "title": (str,),
+    "steps": (list, str),
+    "expected": (str,),
+    "priority": (str,),
+}
+
+
+def _compile_case_validator(schema: Dict[str, tuple]) -> Callable[[Any, str], Optional[List[Dict]]]:
+    """Build the case-list validator once; the returned function only loops over cases."""
+    checks = tuple((key, types, "|".join(t.__name__ for t in types)) for key, types in schema.items())
+
+    def problem(case: Any) -> Optional[str]:
+        if not isinstance(case, dict):
+            return "not a JSON object"
+        for key, types, names in checks:
+            value = case.get(key)
+            if value is not None and not isinstance(value, types):
+                return f"'{key}' must be {names}, got {type(value).__name__}"
+        return None
+
+    def validate(cases: Any, label: str) -> Optional[List[Dict]]:
+        """Schema-conforming cases of `label` (None if it isn't a case list at all)."""
+        logger = logging.getLogger(__name__)
+        if not isinstance(cases, list):
+            logger.warning("Skipping %s: test cases are not a JSON array", label)
+            return None
+        valid: List[Dict] = []
+        for i, case in enumerate(cases, start=1):
+            why = problem(case)
+            if why:
+                logger.warning("Skipping case #%d of %s: %s", i, label, why)
+                continue
+            valid.append(case)
+        return valid
+
+    return validate
+
+
+_VALIDATE = _compile_case_validator(CASE_SCHEMA)
+
+try:
+    # Optional: msgspec decodes + validates against a typed schema in one C pass.
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class _Case(msgspec.Struct):
+        """Typed twin of CASE_SCHEMA for msgspec's specialized decoder."""
+        id: Union[str, int, None] = None
+        title: Optional[str] = None
+        steps: Union[List[Any], str, None] = None
+        expected: Optional[str] = None
+        priority: Optional[str] = None
+
+    _CASES_DECODER = msgspec.json.Decoder(List[_Case])
+    _CASES_BY_REQ_DECODER = msgspec.json.Decoder(Dict[str, List[_Case]])
+else:
+    _CASES_DECODER = _CASES_BY_REQ_DECODER = None
+
+
+def _case_dicts(cases: List[Any]) -> List[Dict]:
+    """Decoded _Case structs → the plain dicts the rest of the pipeline expects."""
+    return [msgspec.structs.asdict(c) for c in cases]
+
+
+class _AlnumTable(dict):
+    """str.translate table: keep [a-z0-9], map every other code point to a space.
+
+    Unknown code points are filled in on first sight, so repeat lookups stay in C.
+    """
+
+    def __missing__(self, key: int) -> str:
+        self[key] = " "
+        return " "
+
+
+_NORM_TABLE = _AlnumTable({ord(ch): ch for ch in "abcdefghijklmnopqrstuvwxyz0123456789"})
+
+
 def _norm(title: str | None) -> str:
     """
     Normalize a title for stable dedupe.
@@ -30,122 +156,384 @@ def _norm(title: str | None) -> str:
     - removes non-alphanumeric (keeps [a-z0-9] only)
     - collapses whitespace
     """
-    s = (title or "").lower().strip()
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = (title or "").lower().translate(_NORM_TABLE)
+    return " ".join(s.split())
 
 
-def main() -> None:
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
-    logger = logging.getLogger(__name__)
+def _title_key(title: str | None) -> str:
+    """Compact dedupe key: 64-bit BLAKE2b digest of the normalized title (16 hex chars)."""
+    return hashlib.blake2b(_norm(title).encode("utf-8"), digest_size=8).hexdigest()
 
-    req_path = pick_requirement(sys.argv[1] if len(sys.argv) > 1 else None, REQ_DIR)
-    requirement_text = req_path.read_text(encoding="utf-8").strip()
-    messages: List[Message] = [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user","content": USER_TEMPLATE.format(requirement_text=requirement_text)},
-    ]
-    logger.info("Calling chat: provider payload msgs=%d (sys=1,user=1)", len(messages))
-    raw = chat(messages)
+
+def _load_existing_titles(logger: logging.Logger, full_refresh: bool = False) -> tuple[set[str], int]:
+    """
+    Title keys (see _title_key) of every case in the TestRail project, plus the
+    fetch cursor to save them under.
+
+    The set is cached in TITLE_CACHE with the time of the last fetch; later runs
+    only ask TestRail for cases updated after that cursor and merge them in.
+    First run, `full_refresh`, or a cache for another server/project falls back
+    to a full fetch.
+    """
+    titles: set[str] = set()
+    cursor: int | None = None
+    if TITLE_CACHE.exists() and not full_refresh:
+        try:
+            cache = json.loads(TITLE_CACHE.read_text(encoding="utf-8"))
+            if cache.get("base") == TESTRAIL_BASE and cache.get("project_id") == TESTRAIL_PROJECT_ID:
+                titles = set(cache["title_keys"])
+                cursor = int(cache["cursor"])
+        except Exception as e:
+            logger.warning("Ignoring unreadable title cache %s: %s", TITLE_CACHE, e)
+            titles, cursor = set(), None
+
+    fetched_at = int(time.time())
+    if cursor is None:
+        fetched = list_cases()  # full fetch
+    else:
+        fetched = list_cases(updated_after=cursor)  # delta since last run
+    logger.info("📥 Fetched %d case(s) from TestRail (%s)", len(fetched), "full" if cursor is None else "delta")
+    titles.update(_title_key(case.get("title")) for case in fetched)
+
+    # Overlap by one second: cases updated within the (truncated) fetch second
+    # have updated_on == fetched_at and must still match updated_after next run.
+    next_cursor = fetched_at - 1
+    _save_title_cache(titles, next_cursor, logger)
+    return titles, next_cursor
+
+
+def _save_title_cache(titles: set[str], cursor: int, logger: logging.Logger) -> None:
+    """Persist title keys for this TestRail server/project; a failed save only loses the cache."""
     try:
-        cases = parse_json_safely(raw, LAST_RAW_JSON)
-    except Exception as e:
-        # gentle retry nudge — a pragmatic teaching technique: show how a
-        # small reminder can correct common model format mistakes.
-        logger.exception("Initial parse_json_safely failed; will nudge and retry. Raw saved at %s",LAST_RAW_JSON,)
-        nudge = (
-            raw + "\n\nREMINDER: Return a pure JSON array only, matching the schema."
+        TITLE_CACHE.write_text(
+            json.dumps({
+                "base": TESTRAIL_BASE,
+                "project_id": TESTRAIL_PROJECT_ID,
+                "cursor": cursor,
+                "title_keys": sorted(titles),
+            }),
+            encoding="utf-8",
         )
-        try:
-            cases = parse_json_safely(nudge, LAST_RAW_JSON)
-        except Exception:
-            # Surface a clear runtime error with a pointer to the saved raw
-            # output so students can debug model responses during the session.
-            logger.error("Could not parse model output after retry; see %s", LAST_RAW_JSON
-)
-            raise RuntimeError(
-                f"Could not parse model output as JSON. See {LAST_RAW_JSON}.\nError: {e}"
-            )
-    rows = to_rows(cases)
-    write_csv(rows, OUT_CSV)
-    
-    # --- Day-4: Act step → push to TestRail mock ---
-    logger.info("ℹ️  Starting TestRail push step")
+    except Exception as e:
+        logger.warning("Could not save title cache %s: %s", TITLE_CACHE, e)
 
-    # Map once → collect payloads (so we dedupe on the exact titles we will POST)
-    payloads: list[dict] = []
+
+def _create_and_seed(p: dict, logger: logging.Logger) -> int | None:
+    """Create one TestRail case and seed its first result; return the case id (None on failure)."""
+    try:
+        res = create_case(p)
+    except Exception as e:
+        logger.error("Create case failed for '%s': %s", p.get("title"), e)
+        return None
+    cid = res.get("id")
+    if cid is None:
+        logger.warning("Create case response missing 'id': %s", res)
+        return None
+    # Seed an initial result for visibility (Untested = 3)
+    try:
+        _ = add_result(int(cid), status_id=3, comment="Seeded by agent on create")
+    except Exception as e:
+        logger.warning("Could not seed result for case %s: %s", cid, e)
+    return int(cid)
+
+
+def _map_payloads(cases: List[Dict], logger: logging.Logger) -> list[tuple[dict, str]]:
+    """Map cases to TestRail payloads paired with their title key (unmappable cases are skipped)."""
+    mapped: list[tuple[dict, str]] = []
     for idx, c in enumerate(cases, start=1):
         try:
             p = map_case_to_testrail_payload(c)
-            payloads.append(p)
         except Exception as e:
             logger.warning("Skipping case %s (mapping error): %s", c.get("id") or idx, e)
+            continue
+        mapped.append((p, _title_key(p.get("title"))))
+    return mapped
+
+
+def _req_id(req_path: Path) -> str:
+    """Requirement id used as delimiter and JSON key (file stem, e.g. 'login')."""
+    return req_path.stem
+
 
-    # Build once: incoming titles from *mapped* payloads
-    incoming_titles = { _norm(p.get("title")) for p in payloads }
+def csv_path_for(req_id: str) -> Path:
+    """CSV output path for one requirement's test cases."""
+    return OUT_DIR / f"test_cases_{req_id}.csv"
 
-    # Build once: existing titles from TestRail (project-wide)
+
+def raw_path_for(req_id: str) -> Path:
+    """Raw LLM output path for one requirement (per-requirement mode)."""
+    return OUT_DIR / f"last_raw_{req_id}.json"
+
+
+def build_messages(req_path: Path) -> List[Message]:
+    """System+user message pair for a single requirement."""
+    prompts = _load_prompts()
+    requirement_text = req_path.read_text(encoding="utf-8").strip()
+    return [
+        {"role": "system", "content": prompts.system},
+        {"role": "user", "content": prompts.user.format(requirement_text=requirement_text)},
+    ]
+
+
+def build_batch_messages(req_paths: List[Path]) -> List[Message]:
+    """One system+user message pair covering every requirement in the batch."""
+    blocks = "\n\n".join(
+        f"---REQ {_req_id(p)}---\n{p.read_text(encoding='utf-8').strip()}" for p in req_paths
+    )
+    prompts = _load_prompts()
+    return [
+        {"role": "system", "content": prompts.batch_system},
+        {"role": "user", "content": prompts.batch_user.format(requirements_block=blocks)},
+    ]
+
+
+def _parse_cases(text: str, raw_path: Path) -> List[Dict]:
+    """Parse a single requirement's JSON array and validate it against CASE_SCHEMA."""
+    if _CASES_DECODER is not None:
+        try:
+            cases = _CASES_DECODER.decode(text)
+        except msgspec.DecodeError:
+            pass  # fences / schema drift → lenient path below
+        else:
+            save_raw(text, raw_path)
+            return _case_dicts(cases)
+    return _VALIDATE(parse_json_safely(text, raw_path), "response") or []
+
+
+def _parse_cases_by_req(text: str, raw_path: Path) -> Dict[str, List[Dict]]:
+    """Parse a batched {req_id: [cases]} object and validate each requirement's cases on its own."""
+    if _CASES_BY_REQ_DECODER is not None:
+        try:
+            by_req = _CASES_BY_REQ_DECODER.decode(text)
+        except msgspec.DecodeError:
+            pass  # fences / schema drift → lenient path below
+        else:
+            save_raw(text, raw_path)
+            return {req_id: _case_dicts(cases) for req_id, cases in by_req.items()}
+    data = parse_json_object_safely(text, raw_path)
+    return {req_id: _VALIDATE(cases, f"requirement {req_id}") for req_id, cases in data.items()}
+
+
+def _loose_key(key: str) -> str:
+    """'Login.txt' / ' login ' → 'login' for forgiving requirement-id matching."""
+    key = key.strip().lower()
+    return key[:-4] if key.endswith(".txt") else key
+
+
+_REQ_N_KEY = re.compile(r"req[-_ ]?(\d+)", re.IGNORECASE)
+
+
+def _match_requirement_keys(
+    req_paths: List[Path], by_key: Dict[str, Any], logger: logging.Logger
+) -> Dict[str, Any]:
+    """
+    Map a batched response's keys back to requirement ids.
+
+    Exact id first, then case-insensitive (ignoring a '.txt' suffix). A key of
+    the form 'REQ-<n>' maps to the n-th requirement (1-based) if that one is
+    still unmatched. Any other key is never guessed at: it is logged and the
+    requirement falls through to "No test cases returned". No match at all raises.
+    """
+    req_ids = [_req_id(p) for p in req_paths]
+    matched: Dict[str, Any] = {}
+    unused = list(by_key)
+    for req_id in req_ids:
+        key = req_id if req_id in by_key else next(
+            (k for k in unused if _loose_key(k) == _loose_key(req_id)), None
+        )
+        if key is not None and key in unused:
+            matched[req_id] = by_key[key]
+            unused.remove(key)
+
+    for key in list(unused):
+        m = _REQ_N_KEY.fullmatch(key.strip())
+        if not m:
+            continue
+        n = int(m.group(1))
+        if 1 <= n <= len(req_ids) and req_ids[n - 1] not in matched:
+            matched[req_ids[n - 1]] = by_key[key]
+            unused.remove(key)
+
+    if unused:
+        logger.warning("Ignoring response key(s) that match no requirement: %s", unused)
+    if not matched:
+        raise RuntimeError(
+            f"Model output keys {list(by_key)} match none of the requirement ids {req_ids}. See {LAST_RAW_JSON}."
+        )
+    return matched
+
+
+def _parse_model_output(
+    raw: str,
+    parse: Callable[[str, Path], Any],
+    logger: logging.Logger,
+    raw_path: Path = LAST_RAW_JSON,
+) -> Any:
+    """Parse model output once (direct JSON first, then fence cleanup) or fail clearly."""
     try:
-        existing = list_cases()  # returns list[dict]
-        existing_titles = { _norm(case.get("title")) for case in existing }
+        return parse(raw, raw_path)
+    except Exception as e:
+        # No second pass: appending a reminder to text that is already invalid
+        # JSON can never make it parse. Surface a clear runtime error with a
+        # pointer to the saved raw output so students can debug model responses.
+        logger.error("Could not parse model output; see %s", raw_path)
+        raise RuntimeError(
+            f"Could not parse model output as JSON. See {raw_path}.\nError: {e}"
+        ) from e
+
+
+# --- Day-4: Act step → push to TestRail mock ---
+def push_to_testrail(cases: List[Dict], logger: logging.Logger, refresh_cache: bool = False) -> list[int]:
+    """
+    Dedupe generated cases against TestRail and create the new ones; return created ids.
+
+    `refresh_cache` ignores the saved title cache and refetches every case
+    (e.g. after the TestRail mock was restarted and lost its data).
+    """
+    logger.info("ℹ️  Starting TestRail push step")
+
+    # Map once → (payload, title key) pairs, so each title is normalized/hashed once
+    # and we dedupe on the exact titles we will POST
+    mapped = _map_payloads(cases, logger)
+
+    # Build once: first payload per incoming title (dict keeps batch order and
+    # drops same-batch duplicates up front)
+    first_by_title: dict[str, dict] = {}
+    for p, n in mapped:
+        if n in first_by_title:
+            logger.info("↪️  Skipping duplicate in this batch: %s", p.get("title"))
+            continue
+        first_by_title[n] = p
+    incoming_titles = first_by_title.keys()
+
+    # Build once: existing titles from TestRail (project-wide, delta-cached)
+    cursor: int | None = None
+    try:
+        existing_titles, cursor = _load_existing_titles(logger, full_refresh=refresh_cache)
     except Exception as e:
         logger.warning("Could not fetch existing titles; proceeding without dedupe: %s", e)
         existing_titles = set()
 
     logger.info("📚 Loaded %d existing titles from TestRail (project-wide)", len(existing_titles))
 
-    # One-shot duplicate report (informational)
+    # One bulk membership pass (set intersection) instead of a lookup per case
     dupes = incoming_titles & existing_titles
     if dupes:
         logger.info(
             "🚧 Detected %d duplicate title(s) in this batch; they will be skipped: %s",
-            len(dupes), sorted(list(dupes))[:5]  # show first few only
+            len(dupes), sorted(first_by_title[k].get("title") for k in dupes)[:5]  # show first few only
         )
     else:
         logger.info("✅ No duplicates detected for this batch")
 
-    created_ids: list[int] = []
-    for p in payloads:
-        title_norm = _norm(p.get("title"))
+    # Titles are unique by now, so concurrent creates never race on a title
+    to_create = [(n, p) for n, p in first_by_title.items() if n not in dupes]
 
-        # Skip if already exists (pre-existing or created earlier in this run)
-        if title_norm in existing_titles:
-            logger.info("↪️  Skipping existing case: %s", p.get("title"))
-            continue
+    # Each case is create → add_result; cases run concurrently (map keeps order)
+    with ThreadPoolExecutor(max_workers=TESTRAIL_WORKERS) as pool:
+        results = list(pool.map(lambda item: _create_and_seed(item[1], logger), to_create))
+    created_ids: list[int] = [cid for cid in results if cid is not None]
 
-        try:
-            res = create_case(p)
-            cid = res.get("id")
-            if cid is not None:
-                created_ids.append(int(cid))         # ✅ safe append
-                existing_titles.add(title_norm)      # prevent same-batch duplicates
-                # Seed an initial result for visibility (Untested = 3)
-                try:
-                    _ = add_result(int(cid), status_id=3, comment="Seeded by agent on create")
-                except Exception as e:
-                    logger.warning("Could not seed result for case %s: %s", cid, e)
-            else:
-                logger.warning("Create case response missing 'id': %s", res)
-        except Exception as e:
-            logger.error("Create case failed for '%s': %s", p.get("title"), e)
+    # Remember what we just created, so the cache never depends on the next delta
+    if cursor is not None and created_ids:
+        existing_titles.update(n for (n, _), cid in zip(to_create, results) if cid is not None)
+        _save_title_cache(existing_titles, cursor, logger)
 
     logger.info("📌 Created %d TestRail cases: %s", len(created_ids), created_ids)
 
-    # Quick verification
+    # Quick verification (a full listing, so it also resyncs the title cache —
+    # e.g. drops titles a restarted mock no longer has)
     try:
+        listed_at = int(time.time())
         all_cases = list_cases()
         logger.info("🧾 TestRail now has %d cases in project", len(all_cases))
+        if cursor is not None:
+            _save_title_cache({_title_key(c.get("title")) for c in all_cases}, listed_at - 1, logger)
     except Exception as e:
         logger.warning("Could not list TestRail cases: %s", e)
 
     logger.info("✅ Test cases pushed to TestRail successfully with id %s", created_ids)
+    return created_ids
 
 
-    
-    logger.info("✅ Test cases pushed to TestRail successfully with id %s", created_ids)
-    logger.info("✅ Wrote %d test cases to: %s", len(rows), OUT_CSV.relative_to(ROOT))  
-    logger.info("ℹ️  Raw model output saved at: %s", LAST_RAW_JSON.relative_to(ROOT))
+async def amain(argv: Optional[list] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    logger = logging.getLogger(__name__)
+
+    parser = argparse.ArgumentParser(description="Generate test cases for requirement files.")
+    parser.add_argument(
+        "requirements",
+        nargs="*",
+        help="Requirement .txt files (default: every file in data/requirements/)",
+    )
+    parser.add_argument(
+        "--per-requirement",
+        action="store_true",
+        help="One concurrent LLM call per requirement instead of a single batched call",
+    )
+    parser.add_argument(
+        "--push-testrail",
+        action="store_true",
+        help="Push the generated cases to the TestRail mock (deduped by title)",
+    )
+    parser.add_argument(
+        "--refresh-testrail-cache",
+        action="store_true",
+        help="With --push-testrail: ignore the saved title cache and refetch every case",
+    )
+    args = parser.parse_args(argv)
+
+    req_paths = pick_requirements(args.requirements, REQ_DIR)
+    cases_by_req: Dict[str, Any]
+    if args.per_requirement:
+        # Independent calls → fire them together; gather preserves input order
+        logger.info("Calling chat: %d concurrent request(s) (sys=1,user=1 each)", len(req_paths))
+        raws = await asyncio.gather(*(achat(build_messages(p)) for p in req_paths))
+        cases_by_req = {}
+        for p, raw in zip(req_paths, raws):
+            req_id = _req_id(p)
+            try:
+                cases_by_req[req_id] = _parse_model_output(raw, _parse_cases, logger, raw_path_for(req_id))
+            except RuntimeError as e:
+                # One bad response only costs its own requirement
+                logger.warning("Skipping requirement %s: %s", req_id, e)
+        raw_outputs = [raw_path_for(_req_id(p)) for p in req_paths]
+    else:
+        # All requirements go out in ONE chat call (one round-trip for the batch)
+        messages = build_batch_messages(req_paths)
+        logger.info("Calling chat: %d requirement(s) batched into msgs=%d (sys=1,user=1)", len(req_paths), len(messages))
+        raw = await achat(messages)
+        cases_by_req = _match_requirement_keys(
+            req_paths, _parse_model_output(raw, _parse_cases_by_req, logger), logger
+        )
+        raw_outputs = [LAST_RAW_JSON]
+
+    # One CSV per requirement, whichever way the cases were generated
+    cases: list[dict] = []
+    for req_path in req_paths:
+        req_id = _req_id(req_path)
+        req_cases = cases_by_req.get(req_id)
+        if not isinstance(req_cases, list):
+            logger.warning("No test cases returned for requirement %s", req_id)
+            continue
+        out_csv = csv_path_for(req_id)
+        n_rows = write_csv(to_rows(req_cases), out_csv)
+        logger.info("✅ Wrote %d test cases to: %s", n_rows, out_csv.relative_to(ROOT))
+        cases.extend(req_cases)
+
+    if args.push_testrail:
+        push_to_testrail(cases, logger, refresh_cache=args.refresh_testrail_cache)
+    else:
+        logger.info("ℹ️  Skipping TestRail push (pass --push-testrail to enable)")
+
+    logger.info("✅ Generated %d test cases for %d requirement(s)", len(cases), len(req_paths))
+    for raw_out in raw_outputs:
+        logger.info("ℹ️  Raw model output saved at: %s", raw_out.relative_to(ROOT))
+
+
+def main(argv: Optional[list] = None) -> None:
+    asyncio.run(amain(argv))
+
 
 if __name__ == "__main__":
     main()
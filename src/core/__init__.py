@@ -7,13 +7,24 @@ Keep this file small: its purpose is purely convenience for teaching and
 to keep example agent files short and readable.
 """
 
-from .llm_client import chat
-from .utils import pick_requirement, parse_json_safely, to_rows, write_csv, write_json
+from .llm_client import chat, achat
+from .utils import (
+    pick_requirement,
+    pick_requirements,
+    parse_json_safely,
+    parse_json_object_safely,
+    to_rows,
+    write_csv,
+    write_json,
+)
 
 __all__ = [
     "chat",
+    "achat",
     "pick_requirement",
+    "pick_requirements",
     "parse_json_safely",
+    "parse_json_object_safely",
     "to_rows",
     "write_csv",
     "write_json",
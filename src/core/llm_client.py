@@ -1,12 +1,11 @@
 # src/core/llm_client.py  (LangChain-backed, drop-in)
 from __future__ import annotations
+import functools
 import os
 import time
 from typing import List, Dict
 from dotenv import load_dotenv
 import logging
-from langchain_openai import ChatOpenAI
-from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 
 # Keep your existing env contract (same keys as before)
@@ -24,6 +23,12 @@ logger = logging.getLogger(__name__)
 Message = Dict[str, str]
 
 
+@functools.lru_cache(maxsize=8)
+def _system_message(content: str) -> SystemMessage:
+    """System prompts repeat across calls; build each SystemMessage only once."""
+    return SystemMessage(content=content)
+
+
 def _to_lc_messages(messages: List[Message]):
     """Convert [{'role','content'}] into LangChain BaseMessages."""
     lc_msgs = []
@@ -31,7 +36,7 @@ def _to_lc_messages(messages: List[Message]):
         role = (m.get("role") or "").lower()
         content = m.get("content") or ""
         if role == "system":
-            lc_msgs.append(SystemMessage(content=content))
+            lc_msgs.append(_system_message(content))
         elif role == "assistant":
             lc_msgs.append(AIMessage(content=content))
         else:
@@ -40,52 +45,103 @@ def _to_lc_messages(messages: List[Message]):
     return lc_msgs
 
 
+@functools.lru_cache(maxsize=1)
 def _make_llm():
     """
     Create the LangChain chat model according to PROVIDER/MODEL envs.
 
+    Built once per process and reused, so every call (including UI-executor
+    triage retries) goes through the same HTTP client and its kept-alive
+    connections instead of a fresh TCP/TLS handshake.
+
+    Only the selected provider's LangChain package is imported (here, on first
+    use): langchain_openai pulls in the OpenAI SDK, langchain_ollama the Ollama
+    client, and neither is needed unless that provider is configured.
+
     Note: We do NOT pass a `timeout` kwarg here for maximum compatibility
     across LangChain versions/backends (e.g., ChatOllama often has no such arg).
     """
     if PROVIDER == "ollama":
         # LangChain's Ollama wrapper reads OLLAMA_HOST from env.
         os.environ["OLLAMA_HOST"] = OLLAMA_HOST
+        from langchain_ollama import ChatOllama
         return ChatOllama(model=MODEL)
     elif PROVIDER == "openai":
         if not OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY is missing but PROVIDER=openai.")
-        # Keep temperature=0 for deterministic teaching runs
-        return ChatOpenAI(model=MODEL, temperature=0)
+        from langchain_openai import ChatOpenAI
+        # Keep temperature=0 for deterministic teaching runs; one JSON response, no SSE
+        return ChatOpenAI(model=MODEL, temperature=0, streaming=False)
     else:
         raise NotImplementedError("Unsupported PROVIDER. Use 'ollama' or 'openai'.")
 
 
-def chat(messages: List[Message], timeout: int = TIMEOUT_S) -> str:
+# Extra invoke kwargs that force a single, non-streamed response.
+# ChatOllama streams internally (and aggregates chunks) even for invoke()
+# unless told otherwise; ChatOpenAI is already pinned via streaming=False.
+_NO_STREAM_KWARGS = {"stream": False} if PROVIDER == "ollama" else {}
+
+
+def _chunk_text(chunks) -> str:
+    return "".join(str(getattr(c, "content", "") or "") for c in chunks)
+
+
+def _validate_messages(messages: List[Message]) -> None:
     if not isinstance(messages, list) or not messages:
         raise ValueError("messages must be a non-empty list of {'role','content'} dicts.")
 
-    # ---- progress: start
+
+def _log_start(messages: List[Message]) -> None:
+    """Progress line for the start of an LLM call (only when LLM_LOG is on)."""
+    if not LLM_LOG:
+        return
+    n_sys = sum(1 for m in messages if (m.get("role") or "").lower() == "system")
+    n_usr = sum(1 for m in messages if (m.get("role") or "").lower() in ("user", "human"))
+    n_ast = sum(1 for m in messages if (m.get("role") or "").lower() in ("assistant", "ai"))
+    msg_count = len(messages)
+
+    size_info = ""
+    if LLM_DEBUG:
+        lengths = [len(m.get("content") or "") for m in messages]
+        size_info = f" | chars={sum(lengths)} total, per_msg={lengths}"
+
+    logger.info(
+        "[LLM] ▶ start provider=%s model=%s msgs=%d (sys=%d, user=%d, asst=%d)%s",
+        PROVIDER,
+        MODEL,
+        msg_count,
+        n_sys,
+        n_usr,
+        n_ast,
+        size_info,
+    )
+
+
+def _log_done(out: str, t0: float) -> None:
+    dt = time.perf_counter() - t0
     if LLM_LOG:
-        n_sys = sum(1 for m in messages if (m.get("role") or "").lower() == "system")
-        n_usr = sum(1 for m in messages if (m.get("role") or "").lower() in ("user", "human"))
-        n_ast = sum(1 for m in messages if (m.get("role") or "").lower() in ("assistant", "ai"))
-        msg_count = len(messages)
-
-        size_info = ""
-        if LLM_DEBUG:
-            lengths = [len(m.get("content") or "") for m in messages]
-            size_info = f" | chars={sum(lengths)} total, per_msg={lengths}"
-
-        logger.info(
-            "[LLM] ▶ start provider=%s model=%s msgs=%d (sys=%d, user=%d, asst=%d)%s",
-            PROVIDER,
-            MODEL,
-            msg_count,
-            n_sys,
-            n_usr,
-            n_ast,
-            size_info,
-        )
+        logger.info("[LLM] ✔ done in %.2fs", dt)
+    if LLM_DEBUG:
+        logger.debug("[LLM] response length=%d", len(out))
+
+
+def _log_error(e: Exception, t0: float) -> None:
+    dt = time.perf_counter() - t0
+    # log exception with stacktrace
+    logger.exception("[LLM] ✖ error after %.2fs: %s", dt, type(e).__name__)
+
+
+def chat(messages: List[Message], timeout: int = TIMEOUT_S, stream: bool = False) -> str:
+    """
+    Send messages to the configured model and return the reply text.
+
+    Callers here only need the final string, so the reply is fetched as one
+    response by default; `stream=True` consumes it chunk by chunk instead.
+    """
+    _validate_messages(messages)
+
+    # ---- progress: start
+    _log_start(messages)
 
     # ---- call model
     t0 = time.perf_counter()
@@ -93,16 +149,43 @@ def chat(messages: List[Message], timeout: int = TIMEOUT_S) -> str:
     lc_msgs = _to_lc_messages(messages)
 
     try:
-        resp = llm.invoke(lc_msgs)
-        out = getattr(resp, "content", "") or ""
-        dt = time.perf_counter() - t0
-        if LLM_LOG:
-            logger.info("[LLM] ✔ done in %.2fs", dt)
-        if LLM_DEBUG:
-            logger.debug("[LLM] response length=%d", len(out))
+        if stream:
+            out = _chunk_text(llm.stream(lc_msgs))
+        else:
+            resp = llm.invoke(lc_msgs, **_NO_STREAM_KWARGS)
+            out = getattr(resp, "content", "") or ""
+        _log_done(out, t0)
+        return out
+    except Exception as e:
+        _log_error(e, t0)
+        raise
+
+
+async def achat(messages: List[Message], timeout: int = TIMEOUT_S, stream: bool = False) -> str:
+    """
+    Async twin of `chat` (same contract, same logging).
+
+    Independent calls can be awaited together with `asyncio.gather` so the
+    provider sees them concurrently instead of one after another.
+    """
+    _validate_messages(messages)
+
+    # ---- progress: start
+    _log_start(messages)
+
+    # ---- call model
+    t0 = time.perf_counter()
+    llm = _make_llm()
+    lc_msgs = _to_lc_messages(messages)
+
+    try:
+        if stream:
+            out = _chunk_text([c async for c in llm.astream(lc_msgs)])
+        else:
+            resp = await llm.ainvoke(lc_msgs, **_NO_STREAM_KWARGS)
+            out = getattr(resp, "content", "") or ""
+        _log_done(out, t0)
         return out
     except Exception as e:
-        dt = time.perf_counter() - t0
-        # log exception with stacktrace
-        logger.exception("[LLM] ✖ error after %.2fs: %s", dt, type(e).__name__)
+        _log_error(e, t0)
         raise
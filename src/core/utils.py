@@ -5,11 +5,16 @@ This module contains small, dependency-free helpers used by agents:
 
 - `pick_requirement(path_arg, req_dir)` — select a requirement file from CLI
   argument or the `req_dir` directory.
+- `pick_requirements(path_args, req_dir)` — same, but for a batch of files
+  (all `.txt` files in `req_dir` when no arguments are given).
 - `parse_json_safely(text, raw_path)` — robustly parse LLM text into JSON
   (tries a minimal cleanup if the model wraps JSON in fences) and saves the
   raw output to `raw_path` for debugging.
-- `to_rows(cases)` — convert a list of JSON case dicts into CSV rows.
-- `write_csv(rows, path)` — write rows to a CSV file without external libs.
+- `save_raw(text, raw_path)` — dump raw LLM text to disk for debugging.
+- `parse_json_object_safely(text, raw_path)` — same, for a top-level JSON
+  object (e.g. test cases keyed by requirement id).
+- `to_rows(cases)` — lazily convert JSON case dicts into CSV rows.
+- `write_csv(rows, path)` — stream rows to a CSV file without external libs.
 
 These are intentionally small helpers designed for teaching. They avoid
 heavyweight dependencies and provide clear points where students can
@@ -19,9 +24,17 @@ experiment (better parsing, schema validation, CSV libraries, etc.).
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Iterable, Iterator, List, Dict
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # Optional fast JSON decoder; falls back to the stdlib when not installed.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 
 def pick_requirement(path_arg: str | None, req_dir: Path) -> Path:
@@ -53,6 +66,58 @@ def pick_requirement(path_arg: str | None, req_dir: Path) -> Path:
     return txts[0]
 
 
+def pick_requirements(path_args: List[str] | None, req_dir: Path) -> List[Path]:
+    """Return Paths to a batch of requirement `.txt` files.
+
+    Behavior:
+    - If `path_args` is non-empty, validate each exists and return them in order.
+    - Otherwise, return every `.txt` file found in `req_dir` (sorted).
+
+    Args:
+        path_args: Optional CLI path strings pointing to requirement files.
+        req_dir: Directory to search for `.txt` files.
+
+    Returns:
+        List[Path]: Resolved paths to the requirement files.
+
+    Raises:
+        FileNotFoundError: If any of `path_args` is missing, or if no
+            `.txt` files exist under `req_dir`.
+    """
+    if path_args:
+        return [pick_requirement(a, req_dir) for a in path_args]
+    txts = sorted(Path(req_dir).glob("*.txt"))
+    if not txts:
+        raise FileNotFoundError(f"No .txt files found in {req_dir}")
+    return txts
+
+
+def save_raw(text: str, raw_path: Path) -> None:
+    """Dump raw LLM text to `raw_path` as UTF-8 bytes with a single write."""
+    raw_path.parent.mkdir(parents=True, exist_ok=True)
+    data = text.encode("utf-8")
+    fd = os.open(str(raw_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _strip_fences(text: str) -> str:
+    """Remove Markdown code fences (and an optional language header)."""
+    cleaned = text.strip()
+    # If the model wrapped JSON in triple-backtick fences, remove them.
+    if cleaned.startswith("```"):
+        # Strip surrounding backticks; if a language header is present
+        # the first line contains it, so drop that line.
+        cleaned = cleaned.strip("`")
+        if "\n" in cleaned:
+            cleaned = cleaned.split("\n", 1)[1]
+    return cleaned
+
+
 def parse_json_safely(text: str, raw_path: Path) -> List[Dict]:
     """Parse raw LLM text into a list of JSON objects, saving raw output.
 
@@ -74,31 +139,53 @@ def parse_json_safely(text: str, raw_path: Path) -> List[Dict]:
         ValueError: If the parsed top-level JSON is not a list.
         json.JSONDecodeError: If JSON parsing fails despite cleanup.
     """
-    raw_path.parent.mkdir(parents=True, exist_ok=True)
-    raw_path.write_text(text, encoding="utf-8")
+    save_raw(text, raw_path)
 
     try:
-        data = json.loads(text)
+        data = _json_loads(text)
         if not isinstance(data, list):
             raise ValueError("Top-level JSON is not a list.")
         return data
     except Exception:
-        cleaned = text.strip()
-        # If the model wrapped JSON in triple-backtick fences, remove them.
-        if cleaned.startswith("```"):
-            # Strip surrounding backticks; if a language header is present
-            # the first line contains it, so drop that line.
-            cleaned = cleaned.strip("`")
-            if "\n" in cleaned:
-                cleaned = cleaned.split("\n", 1)[1]
-        data = json.loads(cleaned)
+        data = _json_loads(_strip_fences(text))
         if not isinstance(data, list):
             raise ValueError("Top-level JSON is not a list after cleanup.")
         return data
 
 
-def to_rows(cases: List[Dict]) -> List[List[str]]:
-    """Convert parsed case dictionaries into CSV-safe rows.
+def parse_json_object_safely(text: str, raw_path: Path) -> Dict[str, Any]:
+    """Parse raw LLM text into a JSON object, saving raw output.
+
+    Same cleanup strategy as `parse_json_safely`, but the top-level JSON is
+    expected to be an object (e.g. `{"login": [...cases], "signup": [...]}`).
+
+    Args:
+        text: Raw string returned by the LLM.
+        raw_path: Path to save the raw text for later inspection.
+
+    Returns:
+        Dict[str, Any]: Parsed JSON object.
+
+    Raises:
+        ValueError: If the parsed top-level JSON is not an object.
+        json.JSONDecodeError: If JSON parsing fails despite cleanup.
+    """
+    save_raw(text, raw_path)
+
+    try:
+        data = _json_loads(text)
+        if not isinstance(data, dict):
+            raise ValueError("Top-level JSON is not an object.")
+        return data
+    except Exception:
+        data = _json_loads(_strip_fences(text))
+        if not isinstance(data, dict):
+            raise ValueError("Top-level JSON is not an object after cleanup.")
+        return data
+
+
+def to_rows(cases: Iterable[Dict]) -> Iterator[List[str]]:
+    """Convert parsed case dictionaries into CSV-safe rows (a generator).
 
     Expected keys in each case dict (all optional):
       - id: unique identifier
@@ -108,16 +195,15 @@ def to_rows(cases: List[Dict]) -> List[List[str]]:
       - priority: priority label (e.g., High/Medium/Low)
 
     The function normalizes missing values, flattens steps into a single
-    string separated by " | ", and returns rows in the order:
+    string separated by " | ", and yields rows in the order:
     [TestID, Title, Steps, Expected, Priority].
 
     Args:
-        cases: List of dictionaries representing test cases.
+        cases: Iterable of dictionaries representing test cases.
 
-    Returns:
-        List[List[str]]: Rows ready for CSV writing.
+    Yields:
+        List[str]: One row per case, ready for CSV writing.
     """
-    rows: List[List[str]] = []
     for i, c in enumerate(cases, start=1):
         tid = str(c.get("id") or f"TC-{i:03d}")
         title = str(c.get("title") or "").strip()
@@ -127,32 +213,36 @@ def to_rows(cases: List[Dict]) -> List[List[str]]:
         steps = " | ".join(str(s).strip() for s in steps_list if str(s).strip())
         expected = str(c.get("expected") or "").strip()
         priority = str(c.get("priority") or "Medium").strip()
-        rows.append([tid, title, steps, expected, priority])
-    return rows
+        yield [tid, title, steps, expected, priority]
 
 
-def write_csv(rows: List[List[str]], path: Path) -> None:
+def write_csv(rows: Iterable[List[str]], path: Path) -> int:
     """Write rows to a CSV file at `path`, creating parent directories.
 
     This simple writer:
     - Writes a header row `["TestID","Title","Steps","Expected","Priority"]`.
     - Escapes commas inside fields by replacing them with semicolons to avoid
       adding CSV quoting logic (keeps the helper dependency-free for teaching).
+    - Streams rows as they arrive, so a generator (e.g. `to_rows`) is never
+      materialized in memory.
 
     Args:
-        rows: List of rows (each row is list of strings).
+        rows: Iterable of rows (each row is list of strings).
         path: Destination file path for the CSV.
 
     Returns:
-        None
+        int: Number of data rows written (header excluded).
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     header = ["TestID", "Title", "Steps", "Expected", "Priority"]
-    lines = [",".join(header)]
-    for r in rows:
-        escaped = [field.replace(",", ";") for field in r]
-        lines.append(",".join(escaped))
-    path.write_text("\n".join(lines), encoding="utf-8")
+    count = 0
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write(",".join(header))
+        for r in rows:
+            escaped = [field.replace(",", ";") for field in r]
+            fh.write("\n" + ",".join(escaped))
+            count += 1
+    return count
 
 
 def write_json(obj: object, path: Path) -> None:
@@ -164,17 +254,23 @@ def write_json(obj: object, path: Path) -> None:
     path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
+# One pooled, keep-alive session shared by the integration helpers below.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+
 def http_post_json(url: str, payload: dict, headers: dict | None = None, timeout: int = 60) -> dict:
-    r = requests.post(url, json=payload, headers=headers or {}, timeout=timeout)
+    r = _SESSION.post(url, json=payload, headers=headers or {}, timeout=timeout)
     r.raise_for_status()
     return r.json()
 
 def http_put_json(url: str, payload: dict, headers: dict | None = None, timeout: int = 60) -> dict:
-    r = requests.put(url, json=payload, headers=headers or {}, timeout=timeout)
+    r = _SESSION.put(url, json=payload, headers=headers or {}, timeout=timeout)
     r.raise_for_status()
     return r.json()
 
 def http_get_json(url: str, headers: dict | None = None, timeout: int = 60) -> dict:
-    r = requests.get(url, headers=headers or {}, timeout=timeout)
+    r = _SESSION.get(url, headers=headers or {}, timeout=timeout)
     r.raise_for_status()
     return r.json()
\ No newline at end of file
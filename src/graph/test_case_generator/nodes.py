@@ -79,9 +79,8 @@ def generate_tests_with_llm(state: TestCaseState) -> TestCaseState:
         state["tests"] = []
         return state
 
-    rows = to_rows(cases)
-    write_csv(rows, OUT_CSV)
-    logger.info(f"✅ Wrote {len(rows)} test cases to {OUT_CSV}")
+    n_rows = write_csv(to_rows(cases), OUT_CSV)
+    logger.info(f"✅ Wrote {n_rows} test cases to {OUT_CSV}")
 
     state["tests"] = [c.get("title", "Untitled Test") for c in cases]
     return state
@@ -11,7 +11,6 @@ from src.graph.ui_executor.nodes import (
     llm_triage,
     persist_to_memory,
     approval_checkpoint,
-    retry_once,
     decide_after_approval,
 )
 
@@ -19,7 +18,8 @@ from src.graph.ui_executor.nodes import (
 def build_ui_app():
     """
     Wire the UI Executor graph with six small nodes:
-      prepare -> run -> parse -> llm_triage -> approve -> (retry|END)
+      prepare -> run -> parse -> llm_triage -> persist -> approve -> (run|END)
+    A retry routes straight back to `run`, which bumps the attempt counter itself.
     """
     g = StateGraph(UIExecState)
 
@@ -30,7 +30,6 @@ def build_ui_app():
     g.add_node("llm_triage", llm_triage)
     g.add_node("persist", persist_to_memory)
     g.add_node("approve", approval_checkpoint)
-    g.add_node("retry", retry_once)
 
     # Linear edges
     g.set_entry_point("prepare")
@@ -40,19 +39,16 @@ def build_ui_app():
     g.add_edge("llm_triage", "persist")
     g.add_edge("persist", "approve")
 
-    # Conditional branch after approval
+    # Conditional branch after approval (retry loops back to execute again)
     g.add_conditional_edges(
         "approve",
         decide_after_approval,
         {
-            "retry": "retry",
+            "retry": "run",
             "end": END,
         },
     )
 
-    # Retry loops back to execute again
-    g.add_edge("retry", "run")
-
     return g.compile()
 
 
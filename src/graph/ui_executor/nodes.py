@@ -42,6 +42,10 @@ def prepare_config(state: UIExecState) -> UIExecState:
 def execute_tests(state: UIExecState) -> UIExecState:
     s = cast(UIExecState, dict(state))
 
+    # Re-entered via the retry edge (a previous run already set run_rc) → next attempt
+    if "run_rc" in s:
+        s = retry_once(s)
+
     cwd_str: str = cast(str, s.get("cwd", "."))
     cwd_path = Path(cwd_str)
     if not cwd_path.exists():
@@ -310,7 +314,7 @@ def decide_after_approval(state: UIExecState) -> str:
     return "end"
 
 
-# ---------- Node 5: retry bookkeeping ----------
+# ---------- Helper: retry bookkeeping (called by execute_tests on re-entry) ----------
 def retry_once(state: UIExecState) -> UIExecState:
     s = cast(UIExecState, dict(state))
     current_attempt = int(s.get("attempt", 1) or 1)
@@ -36,9 +36,12 @@ def create_case(payload: Dict[str, Any], section_id: int | None = None) -> Dict[
     url = f"{TESTRAIL_BASE}/api/v2/cases/{sid}"
     return http_post_json(url, payload)
 
-def list_cases(project_id: int | None = None) -> List[Dict[str, Any]]:
+def list_cases(project_id: int | None = None, updated_after: int | None = None) -> List[Dict[str, Any]]:
+    """List cases in a project; `updated_after` (unix seconds) limits it to recent changes."""
     pid = project_id if project_id is not None else TESTRAIL_PROJECT_ID
     url = f"{TESTRAIL_BASE}/api/v2/cases/{pid}"
+    if updated_after is not None:
+        url += f"?updated_after={int(updated_after)}"
     data = http_get_json(url)
     assert isinstance(data, list), "Expected list from /cases/{project_id}"
     return data